@@ -7,264 +7,474 @@ for the Samstraumr architecture.
 
 Example usage:
     ./bin/c4_diagrams.py --type context
-    ./bin/c4_diagrams.py --type container --output svg
+    ./bin/c4_diagrams.py --type container --output png
     ./bin/c4_diagrams.py --type all
 
+The DOT source of each diagram is frozen into bin/c4_diagrams_dot/ so normal
+runs only have to hand it to Graphviz. After editing the diagram definitions,
+refresh it with:
+    ./bin/c4_diagrams.py --regenerate-dot
+
 Dependencies:
-    - diagrams (pip install diagrams)
-    - graphviz (system package)
+    - graphviz (system package providing the `dot` command)
+    - pygraphviz (optional, pip install pygraphviz) renders in-process
 """
 
 import os
 import sys
 import argparse
+import functools
+import hashlib
+import itertools
+import shutil
+import subprocess
+import tempfile
+from dataclasses import dataclass
 from pathlib import Path
+from types import SimpleNamespace
 
-# Import diagrams if available
+# Diagram definitions live in this file, so outputs newer than it are current.
+# Compiled builds have no source file on disk; there the binary stands in.
 try:
-    from diagrams import Diagram, Cluster
-    from diagrams.programming.language import Java
-    from diagrams.onprem.database import PostgreSQL
-    from diagrams.onprem.client import Users, User
-    from diagrams.onprem.compute import Server
-    from diagrams.generic.storage import Storage
-    from diagrams.programming.framework import Spring
-    diagrams_available = True
-except ImportError:
-    diagrams_available = False
-    print("Warning: diagrams package not available. Please install it with:")
-    print("  pip install diagrams")
-    print("And make sure graphviz is installed:")
-    print("  apt-get install graphviz  # Ubuntu/Debian")
-    print("  brew install graphviz      # macOS")
+    SCRIPT_MTIME = Path(__file__).stat().st_mtime
+except OSError:
+    SCRIPT_MTIME = Path(sys.argv[0]).stat().st_mtime
+
+# DOT sources frozen from the definitions below (see --regenerate-dot)
+DOT_DIR = Path(__file__).resolve().parent / "c4_diagrams_dot"
+
+
+@functools.lru_cache(maxsize=1)
+def _graphviz():
+    """Locate the Graphviz dot executable on first use.
+    
+    Returns:
+        Namespace with the dot path and version and the pygraphviz module if
+        installed, or None if graphviz is missing
+    """
+    dot = shutil.which("dot")
+    if not dot:
+        print("Warning: graphviz not available. Please make sure it is installed:")
+        print("  apt-get install graphviz  # Ubuntu/Debian")
+        print("  brew install graphviz      # macOS")
+        return None
+    version = subprocess.run([dot, "-V"], capture_output=True, text=True).stderr.strip()
+    
+    # Optional: lets diagrams be rendered without spawning dot
+    try:
+        import pygraphviz
+    except ImportError:
+        pygraphviz = None
+    
+    return SimpleNamespace(dot=dot, version=version, pygraphviz=pygraphviz)
+
+
+# Shapes for nodes that are not plain Java components
+NODE_SHAPES = {
+    "Development Teams": "ellipse",
+    "Developer": "ellipse",
+    "Event Store": "cylinder",
+    "Database": "cylinder",
+    "Document Repository": "folder",
+    "Version Control": "box3d",
+    "CI/CD System": "box3d",
+    "CI/CD Pipeline": "box3d",
+}
+
+
+@dataclass(frozen=True)
+class DiagramSpec:
+    """Declarative description of a diagram.
+    
+    Clusters are (label, members) pairs, where members is either a tuple of
+    node labels or a tuple of nested clusters. Edges are (source, destination)
+    node label pairs; nodes outside any cluster are declared by their edges.
+    """
+    name: str
+    title: str
+    clusters: tuple
+    edges: tuple
+    direction: str = "LR"
+    graph_attrs: tuple = ()
+
+
+# Node groups shared between diagrams
+DOMAIN_NODES = ("Tube", "Component", "Identity")
+ORCHESTRATION_NODES = ("Machine", "Composite")
+
+CONTEXT_SPEC = DiagramSpec(
+    name="context",
+    title="Samstraumr System Context",
+    clusters=(
+        ("Samstraumr Framework", ("Samstraumr Core", "API", "Event Store")),
+        ("External Systems", ("Version Control", "CI/CD System", "Document Repository")),
+    ),
+    edges=(
+        ("Development Teams", "API"),
+        ("API", "Samstraumr Core"),
+        ("Samstraumr Core", "Event Store"),
+        ("Development Teams", "Samstraumr Core"),
+        ("Samstraumr Core", "Version Control"),
+        ("Samstraumr Core", "Document Repository"),
+        ("API", "CI/CD System"),
+    ),
+)
+
+CONTAINER_SPEC = DiagramSpec(
+    name="container",
+    title="Samstraumr Container Diagram",
+    clusters=(
+        ("Samstraumr Framework", (
+            ("Core Framework", ("Tubes", "Components", "Identity")),
+            ("Orchestration", ORCHESTRATION_NODES),
+            ("Infrastructure", ("Event Dispatcher", "Event Store")),
+        )),
+        ("External Systems", ("CI/CD Pipeline",)),
+    ),
+    edges=(
+        ("Developer", "Tubes"),
+        ("Tubes", "Event Dispatcher"),
+        ("Developer", "Components"),
+        ("Components", "Machine"),
+        ("Machine", "Composite"),
+        ("Tubes", "Identity"),
+        ("Components", "Identity"),
+        ("Composite", "Identity"),
+        ("Event Dispatcher", "Event Store"),
+        ("Machine", "CI/CD Pipeline"),
+    ),
+)
+
+COMPONENT_SPEC = DiagramSpec(
+    name="component",
+    title="Samstraumr Component Diagram",
+    clusters=(
+        ("Core Domain", (*DOMAIN_NODES, "Lifecycle")),
+        ("Orchestration", (*ORCHESTRATION_NODES, "DataFlow")),
+        ("Infrastructure", ("Repository", "EventDispatcher", "Logger")),
+    ),
+    edges=(
+        ("Tube", "Identity"),
+        ("Component", "Identity"),
+        ("Composite", "Component"),
+        ("Machine", "Component"),
+        ("DataFlow", "Component"),
+        ("Composite", "Repository"),
+        ("Machine", "Repository"),
+        ("EventDispatcher", "Logger"),
+        ("EventDispatcher", "Repository"),
+    ),
+)
+
+CODE_SPEC = DiagramSpec(
+    name="code",
+    title="Samstraumr Code Diagram",
+    clusters=(
+        ("Domain Model", (*DOMAIN_NODES, "LifecycleState")),
+        ("Domain Services", (
+            "TubeFactory", "ComponentFactory", "MachineFactory", "CompositeFactory",
+        )),
+        ("Repositories", ("TubeRepository", "ComponentRepository", "MachineRepository")),
+    ),
+    edges=(
+        ("TubeFactory", "Tube"),
+        ("Tube", "TubeRepository"),
+        ("ComponentFactory", "Component"),
+        ("Component", "ComponentRepository"),
+        ("MachineFactory", "Component"),
+        ("Component", "MachineRepository"),
+        ("CompositeFactory", "Component"),
+        ("Tube", "LifecycleState"),
+        ("Component", "LifecycleState"),
+        ("Tube", "Identity"),
+        ("Component", "Identity"),
+    ),
+    direction="TB",
+)
+
+CLEAN_ARCHITECTURE_SPEC = DiagramSpec(
+    name="clean_architecture",
+    title="Samstraumr Clean Architecture",
+    clusters=(
+        ("Core Domain", ("Entities",)),
+        ("Use Cases", ("Use Cases",)),
+        ("Interface Adapters", (
+            ("Input Adapters", ("Controllers", "Presenters")),
+            ("Output Adapters", ("Gateways", "Repositories")),
+        )),
+        ("Frameworks & Drivers", (
+            ("UI", ("Web UI", "CLI")),
+            ("External Interfaces", ("Database", "External APIs")),
+        )),
+    ),
+    # Dependency Rule: Arrows point inward
+    edges=(
+        ("Web UI", "Controllers"),
+        ("CLI", "Controllers"),
+        ("Controllers", "Use Cases"),
+        ("Presenters", "Use Cases"),
+        ("Use Cases", "Entities"),
+        ("Repositories", "Database"),
+        ("Gateways", "External APIs"),
+        ("Use Cases", "Repositories"),
+        ("Use Cases", "Gateways"),
+        ("Presenters", "Web UI"),
+    ),
+    direction="TB",
+    graph_attrs=(("splines", "polyline"),),
+)
+
+# All diagrams, in generation order
+SPECS = (CONTEXT_SPEC, CONTAINER_SPEC, COMPONENT_SPEC, CODE_SPEC, CLEAN_ARCHITECTURE_SPEC)
+
+
+def _quote(text: str) -> str:
+    """Quote a string for use as a DOT identifier or attribute value."""
+    return '"' + text.replace('"', '\\"') + '"'
+
+
+def _node(label: str) -> str:
+    """Return the DOT statement declaring a node."""
+    shape = NODE_SHAPES.get(label)
+    return f"{_quote(label)} [shape={shape}]" if shape else _quote(label)
+
+
+def _emit_dot(spec: DiagramSpec) -> bytes:
+    """Build the DOT source for a diagram.
+    
+    The source is accumulated in a single growing buffer of the encoded bytes
+    dot reads on stdin, rather than as a list of intermediate strings.
+    
+    Args:
+        spec: Diagram specification
+    
+    Returns:
+        DOT source, UTF-8 encoded
+    """
+    attrs = {
+        "label": spec.title,
+        "labelloc": "t",
+        "rankdir": spec.direction,
+        **dict(spec.graph_attrs),
+    }
+    buf = bytearray(b"digraph {\n")
+    buf += ("  graph [" + ", ".join(f"{k}={_quote(v)}" for k, v in attrs.items()) + "];\n").encode()
+    buf += b"  node [shape=box, style=rounded];\n"
+    declared = set()
+    cluster_ids = itertools.count()
+    
+    def emit_cluster(label, members, indent):
+        nonlocal buf
+        buf += f"{indent}subgraph cluster_{next(cluster_ids)} {{\n".encode()
+        buf += f"{indent}  label={_quote(label)};\n".encode()
+        for member in members:
+            if isinstance(member, tuple):
+                emit_cluster(*member, indent + "  ")
+            else:
+                declared.add(member)
+                buf += f"{indent}  {_node(member)};\n".encode()
+        buf += f"{indent}}}\n".encode()
+    
+    for label, members in spec.clusters:
+        emit_cluster(label, members, "  ")
+    
+    # Nodes outside any cluster are declared on first use
+    for src, dst in spec.edges:
+        for label in (src, dst):
+            if label not in declared:
+                declared.add(label)
+                buf += f"  {_node(label)};\n".encode()
+        buf += f"  {_quote(src)} -> {_quote(dst)};\n".encode()
+    
+    buf += b"}\n"
+    return bytes(buf)
+
+
+def _frozen_header(spec: DiagramSpec) -> bytes:
+    """Return the comment line identifying the spec a frozen DOT file was built from."""
+    key = (spec, sorted(NODE_SHAPES.items()))
+    digest = hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+    return f"// spec {digest}\n".encode()
+
 
 class C4DiagramGenerator:
     """Generate C4 model diagrams for the Samstraumr project."""
     
-    def __init__(self, output_dir: str = "docs/diagrams", output_format: str = "png"):
+    def __init__(self, output_dir: str = "docs/diagrams", output_format: str = "svg"):
         """Initialize the diagram generator.
         
         Args:
             output_dir: Directory to save output files
-            output_format: Output format (png, svg, pdf)
+            output_format: Output format (svg, png, pdf). SVG skips Graphviz's
+                raster pipeline; PNG is only needed by consumers that cannot
+                display SVG.
         """
         self.output_format = output_format.lower()
         if self.output_format not in ("png", "svg", "pdf"):
-            print(f"Unsupported output format: {output_format}, defaulting to png")
-            self.output_format = "png"
+            print(f"Unsupported output format: {output_format}, defaulting to svg")
+            self.output_format = "svg"
         
         # Get output directory
         self.output_dir = Path(output_dir)
         
         # Create output directory if it doesn't exist
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Output paths are fixed per generator, so build them once
+        self._output_files = {
+            spec.name: self.output_dir / f"samstraumr_{spec.name}_diagram.{self.output_format}"
+            for spec in SPECS
+        }
+        
+        # Rendered diagrams, keyed by a hash of their definition
+        self._cache_dir = self.output_dir / ".cache"
     
-    def generate_context_diagram(self) -> str:
-        """Generate a C4 context diagram.
+    def _cache_file(self, dot_source: bytes) -> Path:
+        """Return the cache entry for a diagram.
         
-        Returns:
-            Path to the generated diagram file
+        The key covers everything the rendering depends on: the DOT source
+        that is actually rendered, the output format and the graphviz version.
         """
-        if not diagrams_available:
-            print("Diagrams library not available. Cannot generate context diagram.")
-            return ""
+        key = (dot_source, self.output_format, _graphviz().version)
+        digest = hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+        return self._cache_dir / f"{digest}.{self.output_format}"
+    
+    def _store(self, output_file: Path, cache_file: Path) -> None:
+        """Copy a freshly rendered diagram into the cache."""
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(output_file, cache_file)
+    
+    def _draw(self, dot_source: bytes) -> bytes:
+        """Lay out and render DOT source.
         
-        output_file = self.output_dir / f"samstraumr_context_diagram.{self.output_format}"
+        Args:
+            dot_source: DOT source of the diagram
         
-        try:
-            with Diagram(
-                "Samstraumr System Context",
-                filename=str(output_file.with_suffix("")),
-                outformat=self.output_format,
-                show=False,
-            ):
-                users = Users("Development Teams")
-                
-                with Cluster("Samstraumr Framework"):
-                    core = Java("Samstraumr Core")
-                    api = Java("API")
-                    db = PostgreSQL("Event Store")
-                
-                with Cluster("External Systems"):
-                    vcs = Server("Version Control")
-                    ci = Server("CI/CD System")
-                    docs = Storage("Document Repository")
-                
-                users >> api >> core >> db
-                users >> core
-                core >> vcs
-                core >> docs
-                api >> ci
-            
-            print(f"Generated context diagram: {output_file}")
-            return str(output_file)
+        Returns:
+            Rendered diagram in the output format
+        """
+        graphviz = _graphviz()
+        if graphviz.pygraphviz:
+            # In-process rendering reuses one graphviz context and font cache
+            graph = graphviz.pygraphviz.AGraph(string=dot_source.decode())
+            return graph.draw(format=self.output_format, prog="dot")
         
-        except Exception as e:
-            print(f"Failed to generate context diagram: {e}")
-            return ""
+        # Pipe the source in and the rendering out, with no intermediate files
+        return subprocess.run(
+            [graphviz.dot, f"-T{self.output_format}"],
+            input=dot_source,
+            stdout=subprocess.PIPE,
+            check=True,
+        ).stdout
     
-    def generate_container_diagram(self) -> str:
-        """Generate a C4 container diagram.
+    def _render(self, output_file: Path, spec: DiagramSpec) -> str:
+        """Render a diagram with Graphviz through the content-addressed cache.
+        
+        Args:
+            output_file: Path the diagram should be written to
+            spec: Diagram specification
         
         Returns:
             Path to the generated diagram file
         """
-        if not diagrams_available:
-            print("Diagrams library not available. Cannot generate container diagram.")
-            return ""
+        dot_source = self._frozen_source(spec)
+        cache_file = self._cache_file(dot_source)
+        if cache_file.exists():
+            shutil.copyfile(cache_file, output_file)
+            print(f"From cache: {output_file}")
+            return str(output_file)
         
-        output_file = self.output_dir / f"samstraumr_container_diagram.{self.output_format}"
+        rendered = self._draw(dot_source)
+        output_file.write_bytes(rendered)
         
-        try:
-            with Diagram(
-                "Samstraumr Container Diagram",
-                filename=str(output_file.with_suffix("")),
-                outformat=self.output_format,
-                show=False,
-            ):
-                dev = User("Developer")
-                
-                with Cluster("Samstraumr Framework"):
-                    with Cluster("Core Framework"):
-                        tubes = Java("Tubes")
-                        components = Java("Components")
-                        identity = Java("Identity")
-                        
-                    with Cluster("Orchestration"):
-                        machine = Java("Machine")
-                        composite = Java("Composite")
-                    
-                    with Cluster("Infrastructure"):
-                        events = Java("Event Dispatcher")
-                        db = PostgreSQL("Event Store")
-                
-                with Cluster("External Systems"):
-                    ci_cd = Server("CI/CD Pipeline")
-                
-                dev >> tubes >> events
-                dev >> components >> machine >> composite
-                tubes >> identity
-                components >> identity
-                composite >> identity
-                events >> db
-                machine >> ci_cd
-            
-            print(f"Generated container diagram: {output_file}")
-            return str(output_file)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(rendered)
+        print(f"Generated: {output_file}")
+        return str(output_file)
+    
+    def _frozen_source(self, spec: DiagramSpec) -> bytes:
+        """Return the shipped DOT source of a diagram.
         
-        except Exception as e:
-            print(f"Failed to generate container diagram: {e}")
-            return ""
+        Each frozen file starts with a digest of the specification and node
+        shapes it was built from. The source is built from the specification
+        instead when the file is missing or its digest no longer matches, i.e.
+        when the definitions were edited without running --regenerate-dot.
+        
+        Args:
+            spec: Diagram specification
+        
+        Returns:
+            DOT source, UTF-8 encoded
+        """
+        try:
+            frozen = (DOT_DIR / f"{spec.name}.dot").read_bytes()
+        except OSError:
+            return _emit_dot(spec)
+        if frozen.startswith(_frozen_header(spec)):
+            return frozen
+        return _emit_dot(spec)
     
-    def generate_component_diagram(self) -> str:
-        """Generate a C4 component diagram.
+    def _generate(self, spec: DiagramSpec) -> str:
+        """Generate a single diagram.
+        
+        Generation is skipped when graphviz is missing or the output is
+        already up to date, and failures are reported instead of raised.
+        
+        Args:
+            spec: Diagram specification
         
         Returns:
             Path to the generated diagram file
         """
-        if not diagrams_available:
-            print("Diagrams library not available. Cannot generate component diagram.")
-            return ""
+        # Checked before looking for graphviz, which runs dot -V
+        output_file = self._output_files[spec.name]
+        if output_file.exists() and output_file.stat().st_mtime >= SCRIPT_MTIME:
+            print(f"Up to date: {output_file}")
+            return str(output_file)
         
-        output_file = self.output_dir / f"samstraumr_component_diagram.{self.output_format}"
+        description = spec.name.replace("_", " ")
+        if not _graphviz():
+            print(f"Graphviz not available. Cannot generate {description} diagram.")
+            return ""
         
         try:
-            with Diagram(
-                "Samstraumr Component Diagram",
-                filename=str(output_file.with_suffix("")),
-                outformat=self.output_format,
-                show=False,
-            ):
-                with Cluster("Core Domain"):
-                    tubes = Java("Tube")
-                    components = Java("Component")
-                    identifiers = Java("Identity")
-                    lifecycle = Java("Lifecycle")
-                
-                with Cluster("Orchestration"):
-                    machine = Java("Machine")
-                    composite = Java("Composite")
-                    flow = Java("DataFlow")
-                
-                with Cluster("Infrastructure"):
-                    repo = Java("Repository")
-                    events = Java("EventDispatcher")
-                    logging = Java("Logger")
-                
-                # Connect components
-                tubes >> identifiers
-                components >> identifiers
-                
-                composite >> components
-                machine >> components
-                flow >> components
-                
-                composite >> repo
-                machine >> repo
-                
-                events >> logging
-                events >> repo
-            
-            print(f"Generated component diagram: {output_file}")
-            return str(output_file)
+            return self._render(output_file, spec)
         
         except Exception as e:
-            print(f"Failed to generate component diagram: {e}")
+            print(f"Failed to generate {description} diagram: {e}")
             return ""
     
-    def generate_code_diagram(self) -> str:
-        """Generate a C4 code diagram.
+    def generate_context_diagram(self) -> str:
+        """Generate a C4 context diagram.
         
         Returns:
             Path to the generated diagram file
         """
-        if not diagrams_available:
-            print("Diagrams library not available. Cannot generate code diagram.")
-            return ""
+        return self._generate(CONTEXT_SPEC)
+    
+    def generate_container_diagram(self) -> str:
+        """Generate a C4 container diagram.
         
-        output_file = self.output_dir / f"samstraumr_code_diagram.{self.output_format}"
+        Returns:
+            Path to the generated diagram file
+        """
+        return self._generate(CONTAINER_SPEC)
+    
+    def generate_component_diagram(self) -> str:
+        """Generate a C4 component diagram.
         
-        try:
-            with Diagram(
-                "Samstraumr Code Diagram",
-                filename=str(output_file.with_suffix("")),
-                outformat=self.output_format,
-                show=False,
-                direction="TB",
-            ):
-                with Cluster("Domain Model"):
-                    tube = Java("Tube")
-                    component = Java("Component")
-                    identity = Java("Identity")
-                    state = Java("LifecycleState")
-                
-                with Cluster("Domain Services"):
-                    tube_factory = Java("TubeFactory")
-                    component_factory = Java("ComponentFactory")
-                    machine_factory = Java("MachineFactory")
-                    composite_factory = Java("CompositeFactory")
-                
-                with Cluster("Repositories"):
-                    tube_repo = Java("TubeRepository")
-                    component_repo = Java("ComponentRepository")
-                    machine_repo = Java("MachineRepository")
-                
-                # Connect classes
-                tube_factory >> tube >> tube_repo
-                component_factory >> component >> component_repo
-                machine_factory >> component >> machine_repo
-                composite_factory >> component
-                tube >> state
-                component >> state
-                tube >> identity
-                component >> identity
-            
-            print(f"Generated code diagram: {output_file}")
-            return str(output_file)
+        Returns:
+            Path to the generated diagram file
+        """
+        return self._generate(COMPONENT_SPEC)
+    
+    def generate_code_diagram(self) -> str:
+        """Generate a C4 code diagram.
         
-        except Exception as e:
-            print(f"Failed to generate code diagram: {e}")
-            return ""
+        Returns:
+            Path to the generated diagram file
+        """
+        return self._generate(CODE_SPEC)
     
     def generate_clean_architecture_diagram(self) -> str:
         """Generate a diagram showing the Clean Architecture layers.
@@ -272,63 +482,66 @@ class C4DiagramGenerator:
         Returns:
             Path to the generated diagram file
         """
-        if not diagrams_available:
-            print("Diagrams library not available. Cannot generate clean architecture diagram.")
-            return ""
+        return self._generate(CLEAN_ARCHITECTURE_SPEC)
+    
+    def regenerate_dot(self) -> list:
+        """Freeze the DOT source of every diagram into the DOT directory.
         
-        output_file = self.output_dir / f"samstraumr_clean_architecture_diagram.{self.output_format}"
+        Returns:
+            List of paths to the written DOT files
+        """
+        DOT_DIR.mkdir(parents=True, exist_ok=True)
+        files = []
+        for spec in SPECS:
+            dot_file = DOT_DIR / f"{spec.name}.dot"
+            dot_file.write_bytes(_frozen_header(spec) + _emit_dot(spec))
+            print(f"Wrote {dot_file}")
+            files.append(str(dot_file))
+        return files
+    
+    def _render_batch(self, pending: list) -> list:
+        """Render several diagrams that missed the cache in one go.
+        
+        Args:
+            pending: (name, output file, cache file, DOT source) tuples
         
+        Returns:
+            List of paths to generated diagrams
+        """
+        files = []
         try:
-            with Diagram(
-                "Samstraumr Clean Architecture",
-                filename=str(output_file.with_suffix("")),
-                outformat=self.output_format,
-                show=False,
-                direction="TB",
-                curvestyle="ortho",
-            ):
-                with Cluster("Core Domain"):
-                    entity = Java("Entities")
-                
-                with Cluster("Use Cases"):
-                    usecases = Java("Use Cases")
-                    
-                with Cluster("Interface Adapters"):
-                    with Cluster("Input Adapters"):
-                        controllers = Java("Controllers")
-                        presenters = Java("Presenters")
-                    
-                    with Cluster("Output Adapters"):
-                        gateways = Java("Gateways")
-                        repositories = Java("Repositories")
+            if _graphviz().pygraphviz:
+                # Already a single process with a single graphviz context
+                for _, output_file, cache_file, dot_source in pending:
+                    output_file.write_bytes(self._draw(dot_source))
+                    self._store(output_file, cache_file)
+                    files.append(str(output_file))
+                return files
+            
+            # Render everything with a single dot process, so process start-up
+            # and font cache initialisation are paid once rather than per
+            # diagram. With -O, dot writes <input>.<format> next to each input.
+            with tempfile.TemporaryDirectory(dir=self.output_dir) as tmp:
+                dot_files = []
+                for name, _, _, dot_source in pending:
+                    dot_file = Path(tmp) / f"{name}.dot"
+                    dot_file.write_bytes(dot_source)
+                    dot_files.append(dot_file)
                 
-                with Cluster("Frameworks & Drivers"):
-                    with Cluster("UI"):
-                        web = Spring("Web UI")
-                        cli = Java("CLI")
-                    
-                    with Cluster("External Interfaces"):
-                        db = PostgreSQL("Database")
-                        external_api = Java("External APIs")
-                    
-                # Dependency Rule: Arrows point inward
-                web >> controllers
-                cli >> controllers
-                controllers >> usecases
-                presenters >> usecases
-                usecases >> entity
-                repositories >> db
-                gateways >> external_api
-                usecases >> repositories
-                usecases >> gateways
-                presenters >> web
+                subprocess.run(
+                    [_graphviz().dot, f"-T{self.output_format}", "-O", *map(str, dot_files)],
+                    check=True,
+                )
                 
-            print(f"Generated clean architecture diagram: {output_file}")
-            return str(output_file)
+                for dot_file, (_, output_file, cache_file, _) in zip(dot_files, pending):
+                    os.replace(f"{dot_file}.{self.output_format}", output_file)
+                    self._store(output_file, cache_file)
+                    files.append(str(output_file))
         
         except Exception as e:
-            print(f"Failed to generate clean architecture diagram: {e}")
-            return ""
+            print(f"Failed to generate diagrams: {e}")
+        
+        return files
     
     def generate_all(self) -> list:
         """Generate all C4 diagrams.
@@ -337,54 +550,81 @@ class C4DiagramGenerator:
             List of paths to generated diagrams
         """
         files = []
+        report = []
+        stale = []
+        for spec in SPECS:
+            output_file = self._output_files[spec.name]
+            if output_file.exists() and output_file.stat().st_mtime >= SCRIPT_MTIME:
+                files.append(str(output_file))
+                report.append(f"Up to date: {output_file}")
+            else:
+                stale.append(spec)
         
-        # Context diagram
-        context_file = self.generate_context_diagram()
-        if context_file:
-            files.append(context_file)
-        
-        # Container diagram
-        container_file = self.generate_container_diagram()
-        if container_file:
-            files.append(container_file)
-        
-        # Component diagram
-        component_file = self.generate_component_diagram()
-        if component_file:
-            files.append(component_file)
+        # Only look for graphviz, which runs dot -V, when something is stale
+        if stale and not _graphviz():
+            report.append("Graphviz not available. Cannot generate diagrams.")
+            print("\n".join(report))
+            return files
         
-        # Code diagram
-        code_file = self.generate_code_diagram()
-        if code_file:
-            files.append(code_file)
+        pending = []
+        for spec in stale:
+            output_file = self._output_files[spec.name]
+            dot_source = self._frozen_source(spec)
+            cache_file = self._cache_file(dot_source)
+            if cache_file.exists():
+                shutil.copyfile(cache_file, output_file)
+                files.append(str(output_file))
+                report.append(f"From cache: {output_file}")
+            else:
+                pending.append((spec.name, output_file, cache_file, dot_source))
         
-        # Clean architecture diagram
-        clean_arch_file = self.generate_clean_architecture_diagram()
-        if clean_arch_file:
-            files.append(clean_arch_file)
+        if pending:
+            rendered = self._render_batch(pending)
+            files += rendered
+            report += [f"Generated: {f}" for f in rendered]
         
+        # One write for the whole run rather than one per diagram
+        if report:
+            print("\n".join(report))
         return files
 
 
+# Generator method run for each --type value. "port" is also accepted, for
+# generate-diagrams.sh, but those diagrams come from port_interfaces_diagram.py
+DISPATCH = {
+    "context": "generate_context_diagram",
+    "container": "generate_container_diagram",
+    "component": "generate_component_diagram",
+    "code": "generate_code_diagram",
+    "clean": "generate_clean_architecture_diagram",
+    "all": "generate_all",
+}
+
+
 def main():
     """Main entry point for the script."""
     parser = argparse.ArgumentParser(description="Generate C4 model diagrams for Samstraumr")
     parser.add_argument(
         "--type", 
-        choices=["context", "container", "component", "code", "clean", "port", "all"],
+        choices=[*DISPATCH, "port"],
         default="all",
         help="Type of C4 diagram to generate (default: all)"
     )
     parser.add_argument(
         "--output", 
         choices=["png", "svg", "pdf"],
-        default="png",
-        help="Output format (default: png)"
+        default="svg",
+        help="Output format (default: svg)"
     )
     parser.add_argument(
         "--dir",
         help="Output directory (default: docs/diagrams)"
     )
+    parser.add_argument(
+        "--regenerate-dot",
+        action="store_true",
+        help="Rewrite the frozen DOT sources after editing the diagram definitions"
+    )
     
     args = parser.parse_args()
     
@@ -394,22 +634,17 @@ def main():
         output_format=args.output
     )
     
-    # Generate diagrams based on type
-    if args.type == "context":
-        generator.generate_context_diagram()
-    elif args.type == "container":
-        generator.generate_container_diagram()
-    elif args.type == "component":
-        generator.generate_component_diagram()
-    elif args.type == "code":
-        generator.generate_code_diagram()
-    elif args.type == "clean":
-        generator.generate_clean_architecture_diagram()
-    elif args.type == "port":
+    if args.regenerate_dot:
+        generator.regenerate_dot()
+        return
+    
+    if args.type == "port":
         # Port diagrams are handled separately by port_interfaces_diagram.py
         print("Port interface diagrams are generated by port_interfaces_diagram.py")
-    else:  # "all"
-        generator.generate_all()
+        return
+    
+    # Generate diagrams based on type; the generators report what they did
+    getattr(generator, DISPATCH[args.type])()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,65 @@
+#!/usr/bin/env bash
+#==============================================================================
+# Filename: compile-c4-diagrams.sh
+# Description: Compile the C4 diagram generator into a standalone binary
+#
+# Compiles bin/c4_diagrams.py with Nuitka into bin/c4_diagrams, so repeated
+# documentation builds skip Python interpreter start-up and module imports.
+# generate-diagrams.sh uses the binary whenever it is newer than the script.
+#
+# Copyright (c) 2025 Eric C. Mumford (@heymumford)
+# This file is subject to the terms and conditions defined in
+# the LICENSE file, which is part of this source code package.
+#==============================================================================
+# Usage: ./bin/compile-c4-diagrams.sh
+#
+# Dependencies:
+#   - nuitka (pip install nuitka)
+#   - a C compiler
+#==============================================================================
+
+# Determine script directory and load common library
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "${SCRIPT_DIR}/.." && pwd)"
+
+# Source the unified common library
+if [[ -f "${PROJECT_ROOT}/util/lib/unified-common.sh" ]]; then
+  source "${PROJECT_ROOT}/util/lib/unified-common.sh"
+else
+  # Fallback to original common.sh if unified version not available
+  source "${PROJECT_ROOT}/util/lib/common.sh"
+fi
+
+if [[ "$1" == "--help" ]]; then
+  print_header "C4 Diagram Generator Compiler"
+  echo "Compiles bin/c4_diagrams.py into the standalone binary bin/c4_diagrams."
+  echo ""
+  print_section "Usage"
+  echo "./bin/compile-c4-diagrams.sh"
+  exit 0
+fi
+
+if ! python -m nuitka --version > /dev/null 2>&1; then
+  print_error "Nuitka not available. Please install it with:"
+  echo "  pip install nuitka"
+  exit 1
+fi
+
+BUILD_DIR="${PROJECT_ROOT}/target/nuitka"
+ensure_directory_exists "$BUILD_DIR"
+
+print_info "Compiling bin/c4_diagrams.py..."
+# The frozen DOT sources are bundled next to the module, where the
+# generator looks them up
+if ! python -m nuitka \
+    --onefile \
+    --include-data-dir="${PROJECT_ROOT}/bin/c4_diagrams_dot=c4_diagrams_dot" \
+    --output-dir="$BUILD_DIR" \
+    --output-filename=c4_diagrams \
+    "${PROJECT_ROOT}/bin/c4_diagrams.py"; then
+  print_error "Compilation failed"
+  exit 1
+fi
+
+mv "${BUILD_DIR}/c4_diagrams" "${PROJECT_ROOT}/bin/c4_diagrams"
+print_success "Compiled bin/c4_diagrams"
@@ -135,7 +135,12 @@ function generate_diagrams() {
 
   # Generate diagrams
   print_info "Generating $TYPE C4 diagrams in $FORMAT format..."
-  python "${PROJECT_ROOT}/bin/c4_diagrams.py" --type "$TYPE" --output "$FORMAT" --dir "$OUTPUT_DIR"
+  # Prefer the compiled generator (see compile-c4-diagrams.sh) unless the script changed since
+  if [[ -x "${PROJECT_ROOT}/bin/c4_diagrams" && "${PROJECT_ROOT}/bin/c4_diagrams" -nt "${PROJECT_ROOT}/bin/c4_diagrams.py" ]]; then
+    "${PROJECT_ROOT}/bin/c4_diagrams" --type "$TYPE" --output "$FORMAT" --dir "$OUTPUT_DIR"
+  else
+    python "${PROJECT_ROOT}/bin/c4_diagrams.py" --type "$TYPE" --output "$FORMAT" --dir "$OUTPUT_DIR"
+  fi
   
   # Generate port interface diagrams
   if [[ "$TYPE" == "all" || "$TYPE" == "port" || "$TYPE" == "component" ]]; then
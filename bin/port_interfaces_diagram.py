@@ -8,489 +8,931 @@ relationships in the Samstraumr Clean Architecture implementation.
 Example usage:
     ./bin/port_interfaces_diagram.py --output svg
     ./bin/port_interfaces_diagram.py --detail high
+    ./bin/port_interfaces_diagram.py --dry-run
+
+Each rendered diagram gets a .hash sidecar recording the spec it was drawn
+from, so a run only invokes graphviz for diagrams whose spec has changed
+since they were last rendered. Use --force to render them anyway. The
+sidecars and the layers of a split component diagram are local build
+state and are not committed, so the first run in a checkout renders every
+diagram once.
 
 Dependencies:
-    - diagrams (pip install diagrams)
-    - graphviz (system package)
+    - graphviz (system package providing the `dot` command)
 """
 
 import os
 import sys
 import argparse
+import functools
+import hashlib
+import itertools
+import json
+import logging
+import re
+import shutil
+import subprocess
+import tempfile
+from contextlib import contextmanager
+from enum import Enum
 from pathlib import Path
+from xml.sax.saxutils import escape
+
+log = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=1)
+def _dot() -> str:
+    """Locate the graphviz dot executable on first use.
+    
+    Returns:
+        Path to dot, or an empty string if graphviz is missing
+    """
+    dot = shutil.which("dot")
+    if not dot:
+        log.warning("Graphviz not available. Please make sure it is installed:\n"
+                    "  apt-get install graphviz  # Ubuntu/Debian\n"
+                    "  brew install graphviz      # macOS")
+        return ""
+    return dot
+
+
+@functools.lru_cache(maxsize=1)
+def _dot_version() -> str:
+    """Return the version banner of the graphviz dot executable."""
+    return subprocess.run([_dot(), "-V"], capture_output=True, text=True).stderr.strip()
+
+
+def requires_dot(method):
+    """Make a diagram generator method return "" when graphviz is missing."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not _dot():
+            log.error("Graphviz not available. Cannot generate port interface diagrams.")
+            return ""
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write a text file so readers never observe it partially written."""
+    tmp_file = path.with_name(path.name + ".tmp")
+    tmp_file.write_text(text)
+    os.replace(tmp_file, path)
+
+
+# Shapes standing in for the node kinds used in the diagram specs
+NODE_SHAPES = {
+    "Java": "box",
+    "PostgreSQL": "cylinder",
+    "Storage": "folder",
+    "Server": "box3d",
+    "Spring": "component",
+    "Kafka": "cds",
+    "Grafana": "tab",
+}
+
+
+def _java(labels: tuple) -> tuple:
+    """Return node items for a run of Java type labels."""
+    return tuple(("Java", label) for label in labels)
+
+
+# A diagram spec is a (title, items, edges) tuple. Items are (kind, label)
+# nodes or (label, items[, direction]) clusters; edges are (source, operator,
+# destination) triples where ">>" points at the destination and "<<" back at
+# the source.
+DOMAIN_NODES = ("Component", "Identity", "State", "Machine", "Composite", "DomainEvent")
+
+SERVICE_NODES = (
+    "ComponentService",
+    "NotificationService",
+    "CacheService",
+    "FileSystemService",
+    "ValidationService",
+    "PersistenceService",
+    "EventService",
+    "SecurityService",
+    "MessagingService",
+    "TaskExecutionService",
+    "ConfigurationService",
+)
+
+# Each port interface with the infrastructure adapter implementing it
+PORT_ADAPTERS = (
+    ("NotificationPort", "NotificationAdapter"),
+    ("CachePort", "InMemoryCacheAdapter"),
+    ("FileSystemPort", "StandardFileSystemAdapter"),
+    ("ValidationPort", "ValidationAdapter"),
+    ("PersistencePort", "InMemoryPersistenceAdapter"),
+    ("EventPublisherPort", "EventPublisherAdapter"),
+    ("DataFlowEventPort", "InMemoryEventDispatcher"),
+    ("SecurityPort", "SecurityAdapter"),
+    ("MessagingPort", "InMemoryMessagingAdapter"),
+    ("TaskExecutionPort", "ThreadPoolTaskExecutionAdapter"),
+    ("ConfigurationPort", "ConfigurationAdapter"),
+    ("TemplatePort", "FreemarkerTemplateAdapter"),
+    ("StoragePort", "InMemoryStorageAdapter"),
+    ("ComponentRepository", "InMemoryComponentRepository"),
+)
+PORT_NODES = tuple(port for port, _ in PORT_ADAPTERS)
+ADAPTER_NODES = tuple(adapter for _, adapter in PORT_ADAPTERS)
+
+EDGES_COMPONENT = (
+    # Domain layer relationships
+    ("Component", ">>", "Identity"),
+    ("Component", ">>", "State"),
+    ("Machine", ">>", "Component"),
+    ("Composite", ">>", "Component"),
+    
+    # Application layer - Service to Domain
+    ("ComponentService", ">>", "Component"),
+    ("ComponentService", ">>", "Machine"),
+    ("ComponentService", ">>", "Composite"),
+    
+    # Application layer - Service to Ports
+    ("NotificationService", ">>", "NotificationPort"),
+    ("CacheService", ">>", "CachePort"),
+    ("FileSystemService", ">>", "FileSystemPort"),
+    ("ValidationService", ">>", "ValidationPort"),
+    ("PersistenceService", ">>", "PersistencePort"),
+    ("EventService", ">>", "EventPublisherPort"),
+    ("EventService", ">>", "DataFlowEventPort"),
+    ("SecurityService", ">>", "SecurityPort"),
+    ("MessagingService", ">>", "MessagingPort"),
+    ("TaskExecutionService", ">>", "TaskExecutionPort"),
+    ("ConfigurationService", ">>", "ConfigurationPort"),
+    
+    # Infrastructure - Adapters to Ports
+    *((port, "<<", adapter) for port, adapter in PORT_ADAPTERS),
+    
+    # External connections
+    ("NotificationAdapter", ">>", "Email Server"),
+    ("NotificationAdapter", ">>", "SMS Gateway"),
+    ("StandardFileSystemAdapter", ">>", "File System"),
+    ("InMemoryPersistenceAdapter", ">>", "Database"),
+    ("EventPublisherAdapter", ">>", "Message Bus"),
+    ("InMemoryEventDispatcher", ">>", "Message Bus"),
+)
+
+PORTS_COMPONENT_SPEC = (
+    "Samstraumr Port Interfaces Component Diagram",
+    (
+        ("Domain Layer", _java(DOMAIN_NODES)),
+        ("Application Layer", (
+            ("Services", _java(SERVICE_NODES)),
+            ("Port Interfaces", _java(PORT_NODES)),
+        )),
+        ("Infrastructure Layer", (
+            ("Adapters", _java(ADAPTER_NODES)),
+        )),
+        ("External Systems", (
+            ("External Resources", (
+                ("PostgreSQL", "Database"),
+                ("Storage", "File System"),
+                ("Server", "Email Server"),
+                ("Server", "SMS Gateway"),
+                ("Kafka", "Message Bus"),
+                ("Grafana", "Monitoring"),
+            )),
+        )),
+    ),
+    EDGES_COMPONENT,
+)
+
+PORTS_INTEGRATION_SPEC = (
+    "Samstraumr Port Integration Patterns",
+    (
+        *_java((
+            "NotificationPort",
+            "CachePort",
+            "FileSystemPort",
+            "ValidationPort",
+            "PersistencePort",
+            "EventPublisherPort",
+            "SecurityPort",
+        )),
+        ("Integration Services", _java((
+            "CachingFileService",
+            "EventNotificationService",
+            "ValidationPersistenceService",
+            "SecureFileService",
+        ))),
+    ),
+    (
+        # Cache-FileSystem integration
+        ("CachePort", ">>", "CachingFileService"),
+        ("FileSystemPort", ">>", "CachingFileService"),
+        
+        # Event-Notification integration
+        ("EventPublisherPort", ">>", "EventNotificationService"),
+        ("NotificationPort", "<<", "EventNotificationService"),
+        
+        # Validation-Persistence integration
+        ("ValidationPort", ">>", "ValidationPersistenceService"),
+        ("PersistencePort", "<<", "ValidationPersistenceService"),
+        
+        # Security-FileSystem integration
+        ("SecurityPort", ">>", "SecureFileService"),
+        ("FileSystemPort", "<<", "SecureFileService"),
+    ),
+)
+
+# Core ports shown with their methods in the detailed diagram
+PORT_METHODS = (
+    ("NotificationPort", ("send()", "sendBatch()", "sendAsync()", "register()", "checkStatus()")),
+    ("CachePort", ("get()", "put()", "remove()", "clear()", "contains()")),
+    ("FileSystemPort", ("readFile()", "writeFile()", "deleteFile()", "listFiles()",
+                        "fileExists()")),
+    ("ValidationPort", ("validate()", "validateAll()", "getViolations()", "isValid()")),
+    ("PersistencePort", ("save()", "find()", "delete()", "query()", "transaction()")),
+)
+
+DETAILED_PORTS_SPEC = (
+    "Samstraumr Detailed Port Interfaces",
+    (
+        ("Core Port Interfaces", tuple(
+            (port, (
+                ("Java", port),
+                ("Methods", _java(methods), "LR"),
+            ))
+            for port, methods in PORT_METHODS
+        )),
+    ),
+    (),
+)
+
+# High detail adds the standard implementation of each core port
+_IMPLEMENTATIONS = tuple(
+    (port, adapter) for port, adapter in PORT_ADAPTERS if port in dict(PORT_METHODS)
+)
+DETAILED_PORTS_HIGH_SPEC = (
+    DETAILED_PORTS_SPEC[0],
+    (
+        *DETAILED_PORTS_SPEC[1],
+        ("Standard Implementations", _java(tuple(adapter for _, adapter in _IMPLEMENTATIONS))),
+    ),
+    tuple((port, "<<", adapter) for port, adapter in _IMPLEMENTATIONS),
+)
+
+CLEAN_ARCH_PORTS_SPEC = (
+    "Samstraumr Clean Architecture with Ports and Adapters",
+    (
+        ("Core Domain Layer", _java(("Domain Entities", "Value Objects", "Domain Services"))),
+        ("Application Layer", (
+            ("Java", "Use Cases"),
+            ("Input Ports", _java(("ComponentPort", "MachinePort", "CompositePort")), "TB"),
+            ("Output Ports", _java((
+                "PersistencePort",
+                "NotificationPort",
+                "EventPublisherPort",
+                "FileSystemPort",
+                "CachePort",
+            )), "TB"),
+        )),
+        ("Adapter Layer", (
+            ("Input Adapters", _java(("REST Adapter", "CLI Adapter", "Messaging Adapter"))),
+            ("Output Adapters", _java((
+                "PersistenceAdapter",
+                "NotificationAdapter",
+                "EventAdapter",
+                "FileSystemAdapter",
+                "CacheAdapter",
+            ))),
+        )),
+        ("Infrastructure Layer", (
+            ("Spring", "Spring Framework"),
+            ("PostgreSQL", "PostgreSQL"),
+            ("Storage", "File System"),
+            ("Kafka", "Message Broker"),
+        )),
+    ),
+    (
+        # Domain relationships
+        ("Domain Entities", ">>", "Value Objects"),
+        ("Domain Services", ">>", "Domain Entities"),
+        
+        # Application layer connections
+        ("Use Cases", ">>", "Domain Services"),
+        ("Use Cases", ">>", "Domain Entities"),
+        
+        # Input ports to use cases
+        ("ComponentPort", ">>", "Use Cases"),
+        ("MachinePort", ">>", "Use Cases"),
+        ("CompositePort", ">>", "Use Cases"),
+        
+        # Use cases to output ports
+        ("Use Cases", ">>", "PersistencePort"),
+        ("Use Cases", ">>", "NotificationPort"),
+        ("Use Cases", ">>", "EventPublisherPort"),
+        ("Use Cases", ">>", "FileSystemPort"),
+        ("Use Cases", ">>", "CachePort"),
+        
+        # Input adapters to ports
+        ("ComponentPort", "<<", "REST Adapter"),
+        ("ComponentPort", "<<", "CLI Adapter"),
+        ("MachinePort", "<<", "Messaging Adapter"),
+        
+        # Output ports to adapters
+        ("PersistencePort", "<<", "PersistenceAdapter"),
+        ("NotificationPort", "<<", "NotificationAdapter"),
+        ("EventPublisherPort", "<<", "EventAdapter"),
+        ("FileSystemPort", "<<", "FileSystemAdapter"),
+        ("CachePort", "<<", "CacheAdapter"),
+        
+        # Infrastructure connections
+        ("REST Adapter", ">>", "Spring Framework"),
+        ("PersistenceAdapter", ">>", "PostgreSQL"),
+        ("FileSystemAdapter", ">>", "File System"),
+        ("EventAdapter", ">>", "Message Broker"),
+        ("NotificationAdapter", ">>", "Message Broker"),
+    ),
+)
+
+
+# Output file name, without extension, of each diagram in generation order
+DIAGRAM_BASENAMES = (
+    "samstraumr_ports_component_diagram",
+    "samstraumr_ports_integration_diagram",
+    "samstraumr_detailed_ports_diagram",
+    "samstraumr_clean_arch_ports_diagram",
+)
+
+
+def _quote(text: str) -> str:
+    """Quote a string for use as a DOT identifier or attribute value."""
+    return '"' + text.replace('"', '\\"') + '"'
+
 
-# Import diagrams if available
-try:
-    from diagrams import Diagram, Cluster, Edge
-    from diagrams.programming.language import Java
-    from diagrams.onprem.database import PostgreSQL
-    from diagrams.onprem.client import Users, User
-    from diagrams.onprem.compute import Server
-    from diagrams.generic.storage import Storage
-    from diagrams.programming.framework import Spring
-    from diagrams.generic.os import Windows, LinuxGeneral
-    from diagrams.onprem.network import Nginx
-    from diagrams.onprem.queue import Kafka
-    from diagrams.onprem.monitoring import Grafana
-    diagrams_available = True
-except ImportError:
-    diagrams_available = False
-    print("Warning: diagrams package not available. Please install it with:")
-    print("  pip install diagrams")
-    print("And make sure graphviz is installed:")
-    print("  apt-get install graphviz  # Ubuntu/Debian")
-    print("  brew install graphviz      # macOS")
+def _emit_dot(spec: tuple) -> str:
+    """Build the DOT source for a diagram.
+    
+    Args:
+        spec: Diagram specification
+    
+    Returns:
+        DOT source
+    """
+    title, items, edges = spec
+    lines = [
+        "digraph {",
+        f"  graph [label={_quote(title)}, labelloc=t, rankdir=TB];",
+        "  node [style=rounded];",
+    ]
+    cluster_ids = itertools.count()
+    
+    def emit(entries, indent):
+        for entry in entries:
+            if isinstance(entry[1], tuple):
+                label, members, *direction = entry
+                lines.append(f"{indent}subgraph cluster_{next(cluster_ids)} {{")
+                lines.append(f"{indent}  label={_quote(label)};")
+                if direction:
+                    lines.append(f"{indent}  rankdir={direction[0]};")
+                emit(members, indent + "  ")
+                lines.append(f"{indent}}}")
+            else:
+                kind, label = entry
+                lines.append(f"{indent}{_quote(label)} [shape={NODE_SHAPES[kind]}];")
+    
+    emit(items, "  ")
+    
+    # "<<" keeps the left-hand node first but points the arrow back at it
+    for src, op, dst in edges:
+        attrs = " [dir=back]" if op == "<<" else ""
+        lines.append(f"  {_quote(src)} -> {_quote(dst)}{attrs};")
+    
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def _labels(items: tuple) -> set:
+    """Return the labels of all nodes in a tree of spec items."""
+    labels = set()
+    for entry in items:
+        if isinstance(entry[1], tuple):
+            labels |= _labels(entry[1])
+        else:
+            labels.add(entry[1])
+    return labels
+
+
+def _split_spec(spec: tuple) -> tuple:
+    """Split a spec whose items are all clusters into one spec per cluster.
+    
+    Each part is laid out on its own, so edges between clusters are dropped.
+    
+    Args:
+        spec: Diagram specification
+    
+    Returns:
+        (cluster label, spec) pairs
+    """
+    _, items, edges = spec
+    parts = []
+    for label, members, *_ in items:
+        labels = _labels(members)
+        inner = tuple(edge for edge in edges if edge[0] in labels and edge[2] in labels)
+        parts.append((label, (label, members, inner)))
+    return tuple(parts)
+
+
+def _compose_svg(title: str, part_files: list, output_file: Path) -> None:
+    """Write an SVG stacking separately rendered SVG diagrams under a title.
+    
+    The parts are inlined as nested <svg> elements, because viewers such as
+    browsers showing the file through <img> do not load external images.
+    
+    Args:
+        title: Title shown above the parts
+        part_files: Rendered SVG files, top to bottom
+        output_file: Path the composed SVG should be written to
+    """
+    title_height, gap = 30, 20
+    parts = []
+    for index, part_file in enumerate(part_files):
+        text = part_file.read_text()
+        # Attribute order and units may change if the part went through svgo
+        root = re.search(r"<svg\b[^>]*>", text)
+        size = [re.search(rf'\s{name}="([\d.]+)(?:pt)?"', root.group(0)) if root else None
+                for name in ("width", "height")]
+        if not all(size):
+            raise ValueError(f"Cannot read the size of {part_file}")
+        # Keep element ids unique across the parts
+        body = re.sub(r'\b(id="|href="#)', rf"\g<1>p{index}_",
+                      text[root.end():text.rindex("</svg>")])
+        attrs = re.sub(r'\s(?:x|y|width|height)="[^"]*"', "", root.group(0)[4:-1])
+        parts.append((tuple(float(match.group(1)) for match in size), attrs, body))
+    
+    width = max(w for (w, _), _, _ in parts)
+    height = title_height + sum(h for (_, h), _, _ in parts) + gap * (len(parts) - 1)
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8" standalone="no"?>',
+        '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"'
+        f' width="{width:g}pt" height="{height:g}pt" viewBox="0 0 {width:g} {height:g}">',
+        f'  <text x="{width / 2:g}" y="20" text-anchor="middle" font-family="Times,serif"'
+        f' font-size="14">{escape(title)}</text>',
+    ]
+    y = title_height
+    for (w, h), attrs, body in parts:
+        # One user unit of the composed file is one point, so the part's
+        # size is given without units
+        lines.append(f'  <svg x="{(width - w) / 2:g}" y="{y:g}" width="{w:g}" height="{h:g}"'
+                     f'{attrs}>{body}</svg>')
+        y += h + gap
+    lines.append("</svg>")
+    _write_atomic(output_file, "\n".join(lines) + "\n")
+
+
+class Fmt(Enum):
+    """Output formats graphviz renders the diagrams to."""
+    
+    PNG = "png"
+    SVG = "svg"
+    PDF = "pdf"
 
 
 class PortInterfaceDiagramGenerator:
     """Generate diagrams for port interfaces in the Samstraumr Clean Architecture."""
     
+    _VALID_DETAIL = frozenset({"low", "medium", "high"})
+    _VALID_ENGINES = frozenset({"auto", "dot", "fdp", "neato"})
+    
     def __init__(self, output_dir: str = "docs/diagrams", output_format: str = "svg",
-                 detail_level: str = "medium"):
+                 detail_level: str = "medium", engine: str = "auto", force: bool = False,
+                 split_component: bool = False, optimize: bool = True):
         """Initialize the diagram generator.
         
         Args:
             output_dir: Directory to save output files
             output_format: Output format (png, svg, pdf)
             detail_level: Detail level for diagrams (low, medium, high)
+            engine: Graphviz layout engine (auto, dot, fdp, neato); auto picks
+                one per diagram
+            force: Render diagrams even if their existing files are current
+            split_component: Lay out each layer of the component diagram on its
+                own and compose the results (svg only)
+            optimize: Shrink rendered files with svgo or optipng when installed
         """
-        self.output_format = output_format.lower()
-        if self.output_format not in ("png", "svg", "pdf"):
-            print(f"Unsupported output format: {output_format}, defaulting to svg")
-            self.output_format = "svg"
+        try:
+            self.fmt = Fmt(output_format.lower())
+        except ValueError:
+            log.warning("Unsupported output format: %s, defaulting to svg", output_format)
+            self.fmt = Fmt.SVG
         
         self.detail_level = detail_level.lower()
-        if self.detail_level not in ("low", "medium", "high"):
-            print(f"Unsupported detail level: {detail_level}, defaulting to medium")
+        if self.detail_level not in self._VALID_DETAIL:
+            log.warning("Unsupported detail level: %s, defaulting to medium", detail_level)
             self.detail_level = "medium"
         
-        # Get output directory
+        self.engine = engine.lower()
+        if self.engine not in self._VALID_ENGINES:
+            log.warning("Unsupported layout engine: %s, defaulting to auto", engine)
+            self.engine = "auto"
+        
+        self.force = force
+        self.optimize = optimize
+        
+        self.split_component = split_component and self.fmt is Fmt.SVG
+        if split_component and not self.split_component:
+            log.warning("Split component diagrams need svg output, rendering it whole")
+        
+        # Get output directory; it is created when the first diagram is drawn
         self.output_dir = Path(output_dir)
+    
+    def _dot_command(self, engine: str) -> list:
+        """Return the dot command line, without inputs, for a layout engine."""
+        command = [_dot(), f"-K{engine}", f"-T{self.fmt.value}"]
+        if engine != "dot":
+            # Spread overlapping nodes apart rather than leaving them stacked
+            command.append("-Goverlap=scale")
+        return command
+    
+    def _draw(self, dot_source: str, output_file: Path, engine: str) -> None:
+        """Render DOT source with graphviz.
         
-        # Create output directory if it doesn't exist
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        Args:
+            dot_source: DOT source of the diagram
+            output_file: Path the diagram should be written to
+            engine: Graphviz layout engine
+        """
+        log.debug("Rendering %s with %s", output_file, engine)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Pipe the source through dot rather than round-tripping a temp file
+        result = subprocess.run(
+            self._dot_command(engine),
+            input=dot_source.encode(),
+            stdout=subprocess.PIPE,
+            check=True,
+        )
+        output_file.write_bytes(result.stdout)
     
-    def generate_ports_component_diagram(self) -> str:
-        """Generate a Clean Architecture component diagram with port interfaces.
+    def _optimize(self, *output_files: Path) -> None:
+        """Shrink rendered diagrams in place, if an optimizer is installed.
+        
+        This is best effort: a missing or failing optimizer leaves the files
+        as graphviz wrote them.
+        
+        Args:
+            output_files: Rendered diagrams in the generator's format
+        """
+        if not self.optimize or not output_files:
+            return
+        if self.fmt is Fmt.SVG and shutil.which("svgo"):
+            command = ["svgo", "--multipass", "--quiet"]
+        elif self.fmt is Fmt.PNG and shutil.which("optipng"):
+            command = ["optipng", "-quiet", "-o2"]
+        else:
+            return
+        subprocess.run([*command, *map(str, output_files)], check=False)
+    
+    def _plan(self, spec: tuple, output_file: Path, engine: str = "dot"):
+        """Work out how a diagram would be drawn.
+        
+        The SHA-256 of the DOT source and layout engine is kept in a sidecar
+        next to the output file, so changes to the node shapes invalidate it
+        as well as the spec. A second .meta.json sidecar records the settings
+        and graphviz version the diagram was rendered with. A diagram with a
+        hash but no metadata is trusted on its hash alone.
+        
+        Args:
+            spec: Diagram specification
+            output_file: Path the diagram should be written to
+            engine: Layout engine suited to the diagram, used unless the
+                generator was given an explicit one
         
         Returns:
-            Path to the generated diagram file
+            (output file, engine, DOT source, digest, metadata) tuple, or None
+            if the existing file is current
         """
-        if not diagrams_available:
-            print("Diagrams library not available. Cannot generate component diagram.")
-            return ""
+        if self.engine != "auto":
+            engine = self.engine
+        dot_source = _emit_dot(spec)
+        digest = hashlib.sha256(f"{engine}\n{dot_source}".encode()).hexdigest()
+        # The detail level only changes the detailed diagram's spec, which
+        # the digest already covers, so it is not recorded here
+        meta = {
+            "format": self.fmt.value,
+            "engine": engine,
+            "graphviz": _dot_version(),
+        }
+        if not self.force:
+            try:
+                hash_file = output_file.with_name(output_file.name + ".hash")
+                meta_file = output_file.with_name(output_file.name + ".meta.json")
+                if (output_file.exists() and hash_file.read_text() == digest
+                        and (not meta_file.exists()
+                             or json.loads(meta_file.read_text()) == meta)):
+                    log.debug("%s is up to date", output_file)
+                    return None
+            except (OSError, ValueError):
+                pass
+        return (output_file, engine, dot_source, digest, meta)
+    
+    def _record(self, output_file: Path, digest: str, meta: dict) -> None:
+        """Write the sidecars of a freshly drawn diagram."""
+        # Write the sidecars atomically so an interrupted run never leaves
+        # them claiming a diagram which was not fully written
+        _write_atomic(output_file.with_name(output_file.name + ".hash"), digest)
+        _write_atomic(
+            output_file.with_name(output_file.name + ".meta.json"),
+            json.dumps(meta, indent=2) + "\n",
+        )
+    
+    def _generate(self, description: str, spec: tuple, output_file: Path,
+                  engine: str = "dot") -> bool:
+        """Draw a diagram unless its output already matches the specification.
         
-        output_file = self.output_dir / f"samstraumr_ports_component_diagram.{self.output_format}"
+        Args:
+            description: Diagram name used in messages
+            spec: Diagram specification
+            output_file: Path the diagram should be written to
+            engine: Layout engine suited to the diagram
         
-        try:
-            with Diagram(
-                "Samstraumr Port Interfaces Component Diagram",
-                filename=str(output_file.with_suffix("")),
-                outformat=self.output_format,
-                show=False,
-                direction="TB",
-            ):
-                with Cluster("Domain Layer"):
-                    component = Java("Component")
-                    identity = Java("Identity")
-                    state = Java("State")
-                    machine = Java("Machine")
-                    composite = Java("Composite")
-                    event = Java("DomainEvent")
-                
-                with Cluster("Application Layer"):
-                    with Cluster("Services"):
-                        component_svc = Java("ComponentService")
-                        notification_svc = Java("NotificationService")
-                        cache_svc = Java("CacheService")
-                        file_svc = Java("FileSystemService")
-                        validation_svc = Java("ValidationService")
-                        persistence_svc = Java("PersistenceService")
-                        event_svc = Java("EventService")
-                        security_svc = Java("SecurityService")
-                        messaging_svc = Java("MessagingService")
-                        task_svc = Java("TaskExecutionService")
-                        config_svc = Java("ConfigurationService")
-                    
-                    with Cluster("Port Interfaces"):
-                        notification_port = Java("NotificationPort")
-                        cache_port = Java("CachePort")
-                        file_port = Java("FileSystemPort")
-                        validation_port = Java("ValidationPort")
-                        persistence_port = Java("PersistencePort")
-                        event_pub_port = Java("EventPublisherPort")
-                        dataflow_port = Java("DataFlowEventPort")
-                        security_port = Java("SecurityPort")
-                        messaging_port = Java("MessagingPort")
-                        task_port = Java("TaskExecutionPort")
-                        config_port = Java("ConfigurationPort")
-                        template_port = Java("TemplatePort")
-                        storage_port = Java("StoragePort")
-                        comp_repo_port = Java("ComponentRepository")
-                
-                with Cluster("Infrastructure Layer"):
-                    with Cluster("Adapters"):
-                        notification_adapter = Java("NotificationAdapter")
-                        cache_adapter = Java("InMemoryCacheAdapter")
-                        file_adapter = Java("StandardFileSystemAdapter")
-                        validation_adapter = Java("ValidationAdapter")
-                        persistence_adapter = Java("InMemoryPersistenceAdapter")
-                        event_adapter = Java("EventPublisherAdapter")
-                        event_dispatcher = Java("InMemoryEventDispatcher")
-                        security_adapter = Java("SecurityAdapter")
-                        messaging_adapter = Java("InMemoryMessagingAdapter")
-                        task_adapter = Java("ThreadPoolTaskExecutionAdapter")
-                        config_adapter = Java("ConfigurationAdapter")
-                        template_adapter = Java("FreemarkerTemplateAdapter")
-                        storage_adapter = Java("InMemoryStorageAdapter")
-                        comp_repo_adapter = Java("InMemoryComponentRepository")
-                
-                with Cluster("External Systems"):
-                    with Cluster("External Resources"):
-                        database = PostgreSQL("Database")
-                        file_system = Storage("File System")
-                        email_server = Server("Email Server")
-                        sms_gateway = Server("SMS Gateway")
-                        message_bus = Kafka("Message Bus")
-                        monitoring = Grafana("Monitoring")
-                
-                # Domain layer relationships
-                component >> identity
-                component >> state
-                machine >> component
-                composite >> component
-                
-                # Application layer - Service to Domain
-                component_svc >> component
-                component_svc >> machine
-                component_svc >> composite
-                
-                # Application layer - Service to Ports
-                notification_svc >> notification_port
-                cache_svc >> cache_port
-                file_svc >> file_port
-                validation_svc >> validation_port
-                persistence_svc >> persistence_port
-                event_svc >> event_pub_port
-                event_svc >> dataflow_port
-                security_svc >> security_port
-                messaging_svc >> messaging_port
-                task_svc >> task_port
-                config_svc >> config_port
-                
-                # Infrastructure - Adapters to Ports
-                notification_port << notification_adapter
-                cache_port << cache_adapter
-                file_port << file_adapter
-                validation_port << validation_adapter
-                persistence_port << persistence_adapter
-                event_pub_port << event_adapter
-                dataflow_port << event_dispatcher
-                security_port << security_adapter
-                messaging_port << messaging_adapter
-                task_port << task_adapter
-                config_port << config_adapter
-                template_port << template_adapter
-                storage_port << storage_adapter
-                comp_repo_port << comp_repo_adapter
-                
-                # External connections
-                notification_adapter >> email_server
-                notification_adapter >> sms_gateway
-                file_adapter >> file_system
-                persistence_adapter >> database
-                event_adapter >> message_bus
-                event_dispatcher >> message_bus
-                
-            print(f"Generated port interfaces component diagram: {output_file}")
-            return str(output_file)
+        Returns:
+            True if the diagram was drawn, False if the existing file was current
+        """
+        job = self._plan(spec, output_file, engine)
+        if job is None:
+            return False
         
+        output_file, engine, dot_source, digest, meta = job
+        self._draw(dot_source, output_file, engine)
+        self._optimize(output_file)
+        self._record(output_file, digest, meta)
+        log.info("Generated %s: %s", description, output_file)
+        return True
+    
+    @contextmanager
+    def _diagram(self, basename: str, description: str):
+        """Wrap the generation of one diagram with its error reporting.
+        
+        Whether the diagram was drawn or already current is reported by
+        _generate.
+        
+        Args:
+            basename: Output file name without extension
+            description: Diagram name used in messages
+        
+        Yields:
+            Path the diagram should be written to
+        """
+        output_file = self.output_dir / f"{basename}.{self.fmt.value}"
+        try:
+            yield output_file
         except Exception as e:
-            print(f"Failed to generate port interfaces component diagram: {e}")
-            return ""
+            log.error("Failed to generate %s: %s", description, e)
     
+    @requires_dot
+    def generate_ports_component_diagram(self) -> str:
+        """Generate a Clean Architecture component diagram with port interfaces.
+        
+        Returns:
+            Path to the generated diagram file
+        """
+        with self._diagram("samstraumr_ports_component_diagram",
+                           "port interfaces component diagram") as output_file:
+            if self.split_component:
+                parts = self._component_parts()
+                for part in parts:
+                    self._generate(*part)
+                if self._compose():
+                    log.info("Generated port interfaces component diagram: %s", output_file)
+            else:
+                # Loosely connected clusters of ~60 nodes lay out far faster
+                # with a force-directed engine than with hierarchical dot
+                self._generate("port interfaces component diagram",
+                               PORTS_COMPONENT_SPEC, output_file, "fdp")
+            return str(output_file)
+        return ""
+    
+    @requires_dot
     def generate_ports_integration_diagram(self) -> str:
         """Generate a diagram showing the integration patterns between ports.
         
         Returns:
             Path to the generated diagram file
         """
-        if not diagrams_available:
-            print("Diagrams library not available. Cannot generate port integration diagram.")
-            return ""
-        
-        output_file = self.output_dir / f"samstraumr_ports_integration_diagram.{self.output_format}"
-        
-        try:
-            with Diagram(
-                "Samstraumr Port Integration Patterns",
-                filename=str(output_file.with_suffix("")),
-                outformat=self.output_format,
-                show=False,
-                direction="TB",
-            ):
-                # Create port interfaces
-                notification_port = Java("NotificationPort")
-                cache_port = Java("CachePort")
-                file_port = Java("FileSystemPort")
-                validation_port = Java("ValidationPort")
-                persistence_port = Java("PersistencePort")
-                event_pub_port = Java("EventPublisherPort")
-                security_port = Java("SecurityPort")
-                
-                # Create integration services
-                with Cluster("Integration Services"):
-                    cache_file_svc = Java("CachingFileService")
-                    event_notif_svc = Java("EventNotificationService")
-                    validation_persist_svc = Java("ValidationPersistenceService")
-                    security_file_svc = Java("SecureFileService")
-                
-                # Show integration patterns
-                
-                # Cache-FileSystem integration
-                cache_port >> cache_file_svc
-                file_port >> cache_file_svc
-                
-                # Event-Notification integration
-                event_pub_port >> event_notif_svc
-                notification_port << event_notif_svc
-                
-                # Validation-Persistence integration
-                validation_port >> validation_persist_svc
-                persistence_port << validation_persist_svc
-                
-                # Security-FileSystem integration
-                security_port >> security_file_svc
-                file_port << security_file_svc
-                
-            print(f"Generated port integration diagram: {output_file}")
+        with self._diagram("samstraumr_ports_integration_diagram",
+                           "port integration diagram") as output_file:
+            self._generate("port integration diagram", PORTS_INTEGRATION_SPEC, output_file)
             return str(output_file)
-        
-        except Exception as e:
-            print(f"Failed to generate port integration diagram: {e}")
-            return ""
+        return ""
     
+    @requires_dot
     def generate_detailed_port_diagram(self) -> str:
         """Generate a detailed diagram for each port interface.
         
         Returns:
             Path to the generated diagram file
         """
-        if not diagrams_available:
-            print("Diagrams library not available. Cannot generate detailed port diagram.")
-            return ""
-        
-        output_file = self.output_dir / f"samstraumr_detailed_ports_diagram.{self.output_format}"
-        
-        try:
-            with Diagram(
-                "Samstraumr Detailed Port Interfaces",
-                filename=str(output_file.with_suffix("")),
-                outformat=self.output_format,
-                show=False,
-                direction="TB",
-            ):
-                # Focus on ports with their methods
-                with Cluster("Core Port Interfaces"):
-                    with Cluster("NotificationPort"):
-                        notification = Java("NotificationPort")
-                        with Cluster("Methods", direction="LR"):
-                            Java("send()")
-                            Java("sendBatch()")
-                            Java("sendAsync()")
-                            Java("register()")
-                            Java("checkStatus()")
-                    
-                    with Cluster("CachePort"):
-                        cache = Java("CachePort")
-                        with Cluster("Methods", direction="LR"):
-                            Java("get()")
-                            Java("put()")
-                            Java("remove()")
-                            Java("clear()")
-                            Java("contains()")
-                    
-                    with Cluster("FileSystemPort"):
-                        file_system = Java("FileSystemPort")
-                        with Cluster("Methods", direction="LR"):
-                            Java("readFile()")
-                            Java("writeFile()")
-                            Java("deleteFile()")
-                            Java("listFiles()")
-                            Java("fileExists()")
-                    
-                    with Cluster("ValidationPort"):
-                        validation = Java("ValidationPort")
-                        with Cluster("Methods", direction="LR"):
-                            Java("validate()")
-                            Java("validateAll()")
-                            Java("getViolations()")
-                            Java("isValid()")
-                    
-                    with Cluster("PersistencePort"):
-                        persistence = Java("PersistencePort")
-                        with Cluster("Methods", direction="LR"):
-                            Java("save()")
-                            Java("find()")
-                            Java("delete()")
-                            Java("query()")
-                            Java("transaction()")
-                
-                # Connect with implementation relationships if high detail level
-                if self.detail_level == "high":
-                    with Cluster("Standard Implementations"):
-                        notif_impl = Java("NotificationAdapter")
-                        cache_impl = Java("InMemoryCacheAdapter")
-                        file_impl = Java("StandardFileSystemAdapter")
-                        validation_impl = Java("ValidationAdapter")
-                        persistence_impl = Java("InMemoryPersistenceAdapter")
-                    
-                    # Connect implementations to interfaces
-                    notification << notif_impl
-                    cache << cache_impl
-                    file_system << file_impl
-                    validation << validation_impl
-                    persistence << persistence_impl
-            
-            print(f"Generated detailed port diagram: {output_file}")
+        with self._diagram("samstraumr_detailed_ports_diagram",
+                           "detailed port diagram") as output_file:
+            # Connect with implementation relationships if high detail level
+            if self.detail_level == "high":
+                self._generate("detailed port diagram", DETAILED_PORTS_HIGH_SPEC, output_file)
+            else:
+                self._generate("detailed port diagram", DETAILED_PORTS_SPEC, output_file)
             return str(output_file)
-        
-        except Exception as e:
-            print(f"Failed to generate detailed port diagram: {e}")
-            return ""
+        return ""
     
+    @requires_dot
     def generate_clean_architecture_ports_diagram(self) -> str:
         """Generate a diagram showing ports in the Clean Architecture context.
         
         Returns:
             Path to the generated diagram file
         """
-        if not diagrams_available:
-            print("Diagrams library not available. Cannot generate Clean Architecture ports diagram.")
-            return ""
+        with self._diagram("samstraumr_clean_arch_ports_diagram",
+                           "Clean Architecture ports diagram") as output_file:
+            self._generate("Clean Architecture ports diagram", CLEAN_ARCH_PORTS_SPEC,
+                           output_file)
+            return str(output_file)
+        return ""
+    
+    def _component_parts(self) -> tuple:
+        """Return (description, spec, output file, engine) for each layer of
+        the split component diagram."""
+        basename = DIAGRAM_BASENAMES[0]
+        return tuple(
+            (f"port interfaces component diagram ({label})", spec,
+             self.output_dir / f"{basename}_{label.split()[0].lower()}.svg", "dot")
+            for label, spec in _split_spec(PORTS_COMPONENT_SPEC)
+        )
+    
+    def _composed_digest(self):
+        """Return the digest identifying the composed component diagram.
         
-        output_file = self.output_dir / f"samstraumr_clean_arch_ports_diagram.{self.output_format}"
+        It covers the digests of the layers it is built from, so it never
+        matches the digest of the diagram drawn as a whole, and switching
+        between split and whole rendering always redraws the file.
         
+        Returns:
+            Digest, or None if a layer has not been drawn
+        """
+        try:
+            part_digests = [part[2].with_name(part[2].name + ".hash").read_text()
+                            for part in self._component_parts()]
+        except OSError:
+            return None
+        source = "split inline\n" + "\n".join(part_digests)
+        return hashlib.sha256(source.encode()).hexdigest()
+    
+    def _composed_is_current(self) -> bool:
+        """Check whether the composed component diagram matches its layers."""
+        composed = self.output_dir / f"{DIAGRAM_BASENAMES[0]}.svg"
+        digest = self._composed_digest()
         try:
-            with Diagram(
-                "Samstraumr Clean Architecture with Ports and Adapters",
-                filename=str(output_file.with_suffix("")),
-                outformat=self.output_format,
-                show=False,
-                direction="TB",
-            ):
-                with Cluster("Core Domain Layer"):
-                    entities = Java("Domain Entities")
-                    value_objects = Java("Value Objects")
-                    domain_services = Java("Domain Services")
-                
-                with Cluster("Application Layer"):
-                    use_cases = Java("Use Cases")
-                    
-                    with Cluster("Input Ports", direction="TB"):
-                        component_port = Java("ComponentPort")
-                        machine_port = Java("MachinePort")
-                        composite_port = Java("CompositePort")
-                    
-                    with Cluster("Output Ports", direction="TB"):
-                        persistence_port = Java("PersistencePort")
-                        notification_port = Java("NotificationPort")
-                        event_port = Java("EventPublisherPort")
-                        file_port = Java("FileSystemPort")
-                        cache_port = Java("CachePort")
-                
-                with Cluster("Adapter Layer"):
-                    with Cluster("Input Adapters"):
-                        rest_adapter = Java("REST Adapter")
-                        cli_adapter = Java("CLI Adapter")
-                        messaging_adapter = Java("Messaging Adapter")
-                    
-                    with Cluster("Output Adapters"):
-                        persistence_adapter = Java("PersistenceAdapter")
-                        notification_adapter = Java("NotificationAdapter")
-                        event_adapter = Java("EventAdapter")
-                        file_adapter = Java("FileSystemAdapter")
-                        cache_adapter = Java("CacheAdapter")
-                
-                with Cluster("Infrastructure Layer"):
-                    rest_framework = Spring("Spring Framework")
-                    database = PostgreSQL("PostgreSQL")
-                    file_system = Storage("File System")
-                    message_broker = Kafka("Message Broker")
-                
-                # Domain relationships
-                entities >> value_objects
-                domain_services >> entities
-                
-                # Application layer connections
-                use_cases >> domain_services
-                use_cases >> entities
-                
-                # Input ports to use cases
-                component_port >> use_cases
-                machine_port >> use_cases
-                composite_port >> use_cases
-                
-                # Use cases to output ports 
-                use_cases >> persistence_port
-                use_cases >> notification_port
-                use_cases >> event_port
-                use_cases >> file_port
-                use_cases >> cache_port
-                
-                # Input adapters to ports
-                component_port << rest_adapter
-                component_port << cli_adapter
-                machine_port << messaging_adapter
-                
-                # Output ports to adapters
-                persistence_port << persistence_adapter
-                notification_port << notification_adapter
-                event_port << event_adapter
-                file_port << file_adapter
-                cache_port << cache_adapter
-                
-                # Infrastructure connections
-                rest_adapter >> rest_framework
-                persistence_adapter >> database
-                file_adapter >> file_system
-                event_adapter >> message_broker
-                notification_adapter >> message_broker
+            return (digest is not None and composed.exists()
+                    and composed.with_name(composed.name + ".hash").read_text() == digest)
+        except OSError:
+            return False
+    
+    def _compose(self) -> bool:
+        """Compose the split component diagram from its drawn layers.
+        
+        Returns:
+            True if the composed file was written, False if it was current
+        """
+        composed = self.output_dir / f"{DIAGRAM_BASENAMES[0]}.svg"
+        if not self.force and self._composed_is_current():
+            log.debug("%s is up to date", composed)
+            return False
+        _compose_svg(PORTS_COMPONENT_SPEC[0], [part[2] for part in self._component_parts()],
+                     composed)
+        _write_atomic(composed.with_name(composed.name + ".hash"), self._composed_digest())
+        # Settings of a previous whole rendering no longer describe the file
+        composed.with_name(composed.name + ".meta.json").unlink(missing_ok=True)
+        return True
+    
+    def _diagrams(self) -> tuple:
+        """Return (description, spec, output file, engine) for every diagram.
+        
+        A split component diagram is listed as its layers.
+        """
+        detailed = DETAILED_PORTS_HIGH_SPEC if self.detail_level == "high" else DETAILED_PORTS_SPEC
+        diagrams = (
+            ("port interfaces component diagram", PORTS_COMPONENT_SPEC, "fdp"),
+            ("port integration diagram", PORTS_INTEGRATION_SPEC, "dot"),
+            ("detailed port diagram", detailed, "dot"),
+            ("Clean Architecture ports diagram", CLEAN_ARCH_PORTS_SPEC, "dot"),
+        )
+        diagrams = tuple(
+            (description, spec, self.output_dir / f"{basename}.{self.fmt.value}", engine)
+            for basename, (description, spec, engine) in zip(DIAGRAM_BASENAMES, diagrams)
+        )
+        if self.split_component:
+            diagrams = self._component_parts() + diagrams[1:]
+        return diagrams
+    
+    def stale_outputs(self) -> list:
+        """List the files a run would write, without drawing anything.
+        
+        Without graphviz the existing files cannot be checked against their
+        specs, so every file is listed.
+        
+        Returns:
+            Paths of the diagrams that need rendering, in generation order
+        """
+        check = bool(_dot())
+        stale = [
+            output_file for _, spec, output_file, engine in self._diagrams()
+            if not check or self._plan(spec, output_file, engine) is not None
+        ]
+        if self.split_component and (stale or not self._composed_is_current()):
+            stale.append(self.output_dir / f"{DIAGRAM_BASENAMES[0]}.svg")
+        return stale
+    
+    def is_up_to_date(self) -> bool:
+        """Check whether every diagram already matches its specification.
+        
+        Returns:
+            True if no diagram needs rendering
+        """
+        return bool(_dot()) and not self.stale_outputs()
+    
+    def _render_batch(self, jobs: list) -> None:
+        """Render diagrams sharing a layout engine with a single dot process.
+        
+        Process start-up and plugin loading are paid once rather than per
+        diagram. With -O, dot writes <input>.<format> next to each input.
+        
+        Args:
+            jobs: Tuples returned by _plan, all using the same engine
+        """
+        log.debug("Rendering %d diagrams with %s", len(jobs), jobs[0][1])
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=self.output_dir) as tmp:
+            dot_files = []
+            for index, (_, _, dot_source, _, _) in enumerate(jobs):
+                dot_file = Path(tmp) / f"{index}.dot"
+                dot_file.write_text(dot_source)
+                dot_files.append(str(dot_file))
             
-            print(f"Generated Clean Architecture ports diagram: {output_file}")
-            return str(output_file)
+            subprocess.run([*self._dot_command(jobs[0][1]), "-O", *dot_files], check=True)
+            
+            for dot_file, (output_file, _, _, _, _) in zip(dot_files, jobs):
+                os.replace(f"{dot_file}.{self.fmt.value}", output_file)
         
-        except Exception as e:
-            print(f"Failed to generate Clean Architecture ports diagram: {e}")
-            return ""
+        self._optimize(*(job[0] for job in jobs))
+        for output_file, _, _, digest, meta in jobs:
+            self._record(output_file, digest, meta)
     
     def generate_all(self) -> list:
         """Generate all port interface diagrams.
         
+        Only the diagrams that are rendered are reported; a failed batch is
+        reported and does not stop the others.
+        
         Returns:
-            List of paths to generated diagrams
+            List of paths to the diagrams that are up to date after the run;
+            a split component diagram is listed as its composed file
         """
-        files = []
+        if not _dot():
+            log.error("Graphviz not available. Cannot generate port interface diagrams.")
+            return []
+        
+        diagrams = self._diagrams()
+        
+        descriptions = {output_file: description for description, _, output_file, _ in diagrams}
         
-        # Ports component diagram
-        ports_component_file = self.generate_ports_component_diagram()
-        if ports_component_file:
-            files.append(ports_component_file)
+        # dot takes a single -K per run, so batch the stale diagrams by engine
+        done = set()
+        batches = {}
+        for _, spec, output_file, engine in diagrams:
+            job = self._plan(spec, output_file, engine)
+            if job is None:
+                done.add(output_file)
+            else:
+                batches.setdefault(job[1], []).append(job)
         
-        # Ports integration diagram
-        ports_integration_file = self.generate_ports_integration_diagram()
-        if ports_integration_file:
-            files.append(ports_integration_file)
+        for jobs in batches.values():
+            try:
+                self._render_batch(jobs)
+            except Exception as e:
+                names = ", ".join(descriptions[job[0]] for job in jobs)
+                log.error("Failed to generate %s: %s", names, e)
+                continue
+            for job in jobs:
+                log.info("Generated %s: %s", descriptions[job[0]], job[0])
+                done.add(job[0])
         
-        # Detailed port diagram
-        detailed_port_file = self.generate_detailed_port_diagram()
-        if detailed_port_file:
-            files.append(detailed_port_file)
+        files = [str(output_file) for _, _, output_file, _ in diagrams if output_file in done]
         
-        # Clean Architecture ports diagram
-        clean_arch_ports_file = self.generate_clean_architecture_ports_diagram()
-        if clean_arch_ports_file:
-            files.append(clean_arch_ports_file)
+        if self.split_component:
+            # Report the composed diagram in place of its layers
+            parts = self._component_parts()
+            files = files[sum(part[2] in done for part in parts):]
+            if all(part[2] in done for part in parts):
+                composed = self.output_dir / f"{DIAGRAM_BASENAMES[0]}.svg"
+                try:
+                    if self._compose():
+                        log.info("Generated port interfaces component diagram: %s", composed)
+                except Exception as e:
+                    log.error("Failed to generate port interfaces component diagram: %s", e)
+                else:
+                    files.insert(0, str(composed))
         
         return files
 
@@ -500,7 +942,7 @@ def main():
     parser = argparse.ArgumentParser(description="Generate port interface diagrams for Samstraumr")
     parser.add_argument(
         "--output", 
-        choices=["png", "svg", "pdf"],
+        choices=[fmt.value for fmt in Fmt],
         default="svg",
         help="Output format (default: svg)"
     )
@@ -514,23 +956,89 @@ def main():
         "--dir",
         help="Output directory (default: docs/diagrams)"
     )
+    parser.add_argument(
+        "--engine",
+        choices=["auto", "dot", "fdp", "neato"],
+        default="auto",
+        help="Graphviz layout engine; auto picks one per diagram (default: auto)"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="List the diagrams that would be generated without rendering them"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate diagrams even if their specs are unchanged"
+    )
+    parser.add_argument(
+        "--split-component",
+        action="store_true",
+        help="Lay out each layer of the component diagram separately and compose "
+             "them into one SVG; faster, but drops the edges between layers"
+    )
+    parser.add_argument(
+        "--no-optimize",
+        dest="optimize",
+        action="store_false",
+        help="Skip shrinking the rendered files with svgo or optipng"
+    )
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only report warnings and errors"
+    )
+    verbosity.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Also report which diagrams are rendered and which are skipped"
+    )
     
     args = parser.parse_args()
     
+    if args.quiet:
+        level = logging.WARNING
+    elif args.verbose:
+        level = logging.DEBUG
+    else:
+        level = logging.INFO
+    logging.basicConfig(level=level, format="%(message)s", stream=sys.stdout)
+    
     # Initialize generator
     generator = PortInterfaceDiagramGenerator(
         output_dir=args.dir or "docs/diagrams",
         output_format=args.output,
-        detail_level=args.detail
+        detail_level=args.detail,
+        engine=args.engine,
+        force=args.force,
+        split_component=args.split_component,
+        optimize=args.optimize
     )
     
+    # Report the plan without creating directories or laying out any diagram
+    if args.dry_run:
+        print(f"Format: {generator.fmt.value}, detail: {generator.detail_level}, "
+              f"engine: {generator.engine}")
+        stale = generator.stale_outputs()
+        for output_file in stale:
+            print(f"Would generate: {output_file}")
+        if not stale:
+            print("No changes; nothing to generate")
+        return
+    
+    if not args.force and generator.is_up_to_date():
+        log.info("No changes; skipping (use --force to regenerate)")
+        return
+    
     # Generate all diagrams
     generated_files = generator.generate_all()
     
     if generated_files:
-        print(f"Generated {len(generated_files)} port interface diagrams")
+        log.info("%d port interface diagrams up to date", len(generated_files))
     else:
-        print("Failed to generate port interface diagrams")
+        log.error("Failed to generate port interface diagrams")
 
 
 if __name__ == "__main__":